@@ -1,10 +1,29 @@
 import os
+import logging
 from dotenv import load_dotenv
 from typing import List
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+
+def _get_positive_int(name: str, default: int) -> int:
+    """Read a positive integer from the environment, falling back to default."""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        parsed = 0
+    if parsed < 1:
+        logger.warning(f"Invalid {name}={value!r}, using default {default}")
+        return default
+    return parsed
+
+
 class Config:
     """Configuration management for YouTube RSS feeds."""
     
@@ -14,6 +33,9 @@ class Config:
         'UCBJycsmduvYEL83R_U4JriQ,UCrqM0Ym_NbK1fqeQG2VIohg'
     ).split(',')
     
+    # Number of channel feeds fetched in parallel
+    FETCH_WORKERS: int = _get_positive_int('FETCH_WORKERS', 8)
+    
     # Output configuration
     OUTPUT_FILE: str = os.getenv('OUTPUT_FILE', 'feeds.json')
     
@@ -6,10 +6,9 @@ Main application entry point for fetching YouTube RSS feeds.
 
 import sys
 import logging
-import schedule
-import time
-from datetime import datetime
-import pytz
+import signal
+import threading
+from datetime import datetime, timedelta
 from youtube_feed_fetcher import YouTubeFeedFetcher
 from config import Config
 
@@ -24,6 +23,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Daily fetch time (HH:MM, local time)
+FETCH_TIME = "09:00"
+
+# Upper bound on a single wait so clock changes are picked up within the hour
+MAX_IDLE_SECONDS = 3600
+
+# Set by SIGINT/SIGTERM to wake the scheduler loop and shut it down
+stop_event = threading.Event()
+
+def handle_stop_signal(signum, frame):
+    """Ask the scheduler loop to stop at its next wake-up."""
+    logger.info(f"Received {signal.Signals(signum).name}, stopping...")
+    stop_event.set()
+
 def run_feed_fetch():
     """Run a single feed fetch operation."""
     logger.info("=" * 50)
@@ -43,15 +56,25 @@ def run_feed_fetch():
     
     logger.info("=" * 50)
 
-def setup_scheduler():
-    """Set up the scheduled feed fetching."""
-    # Schedule daily fetch at 09:00
-    schedule.every().day.at("09:00").do(run_feed_fetch)
-    logger.info("Scheduled feed fetch daily at 09:00")
+def get_next_run_time() -> datetime:
+    """Return the next local datetime at which the daily fetch is due."""
+    now = datetime.now()
+    hour, minute = map(int, FETCH_TIME.split(":"))
+    next_run = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if next_run <= now:
+        next_run += timedelta(days=1)
+    return next_run
+
+def setup_scheduler() -> datetime:
+    """Set up the scheduled feed fetching and return the first run time."""
+    next_run = get_next_run_time()
+    logger.info(f"Scheduled feed fetch daily at {FETCH_TIME}")
     
     # Run initial fetch
     logger.info("Running initial feed fetch...")
     run_feed_fetch()
+    
+    return next_run
 
 def main():
     """Main application entry point."""
@@ -64,16 +87,26 @@ def main():
         return
     
     # Set up scheduler for continuous operation
-    setup_scheduler()
+    next_run = setup_scheduler()
+    
+    # Ctrl+C locally and SIGTERM from container platforms both end the wait
+    signal.signal(signal.SIGINT, handle_stop_signal)
+    signal.signal(signal.SIGTERM, handle_stop_signal)
     
     logger.info("Scheduler started. Press Ctrl+C to stop.")
     
     try:
-        while True:
-            schedule.run_pending()
-            time.sleep(60)  # Check every minute
-    except KeyboardInterrupt:
-        logger.info("Application stopped by user")
+        while not stop_event.is_set():
+            # Sleep until the next fetch is due instead of polling
+            delay = (next_run - datetime.now()).total_seconds()
+            if delay > 0:
+                stop_event.wait(timeout=min(delay, MAX_IDLE_SECONDS))
+                continue
+            
+            run_feed_fetch()
+            next_run = get_next_run_time()
+        
+        logger.info("Application stopped")
     except Exception as e:
         logger.error(f"Unexpected error: {e}")
         sys.exit(1)
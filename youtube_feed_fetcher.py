@@ -1,25 +1,85 @@
-import feedparser
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
 import logging
-from datetime import datetime
+import re
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from datetime import datetime, timezone
 from typing import List, Dict, Optional
-import pytz
 from config import Config
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Matches watch?v=<id> and youtu.be/<id> links
+_VIDEO_ID_RE = re.compile(
+    r"(?:[?&]v=|youtu\.be/)([A-Za-z0-9_-]{11})(?![A-Za-z0-9_-])"
+)
+
+# XML namespaces used by YouTube's Atom feeds
+_NS = {
+    "atom": "http://www.w3.org/2005/Atom",
+    "media": "http://search.yahoo.com/mrss/",
+    "yt": "http://www.youtube.com/xml/schemas/2015",
+}
+
+
+def _alternate_link(element: ET.Element) -> str:
+    """Return the href of an Atom element's rel="alternate" link."""
+    link = element.find("atom:link[@rel='alternate']", _NS)
+    return link.get("href", "") if link is not None else ""
+
+
+# Qualified tags of the text fields read from each <entry>
+_ENTRY_TEXT_TAGS = {
+    f"{{{_NS['atom']}}}title": "title",
+    f"{{{_NS['atom']}}}published": "published",
+    f"{{{_NS['yt']}}}videoId": "video_id",
+    f"{{{_NS['media']}}}description": "description",
+}
+_ATOM_LINK = f"{{{_NS['atom']}}}link"
+_MEDIA_THUMBNAIL = f"{{{_NS['media']}}}thumbnail"
+
+
+def _entry_fields(entry: ET.Element) -> Dict[str, str]:
+    """Collect an entry's text fields, link and thumbnail in a single walk."""
+    fields = {}
+    for element in entry.iter():
+        key = _ENTRY_TEXT_TAGS.get(element.tag)
+        if key:
+            fields.setdefault(key, element.text or "")
+        elif element.tag == _ATOM_LINK and element.get("rel") == "alternate":
+            fields.setdefault("link", element.get("href", ""))
+        elif element.tag == _MEDIA_THUMBNAIL:
+            fields.setdefault("thumbnail", element.get("url", ""))
+    return fields
+
 
 class YouTubeFeedFetcher:
     """Fetches and processes YouTube RSS feeds."""
 
     def __init__(self):
-        self.config = Config()
+        # Config values are resolved once at import; share the class rather
+        # than building a fresh instance per fetcher
+        self.config = Config
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": "YouTube RSS Feed Fetcher/1.0"})
 
+        # Keep one pooled connection per worker so parallel fetches reuse
+        # sockets, and let urllib3 back off on rate limits and server errors
+        self.max_workers = self.config.FETCH_WORKERS
+        retries = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+        )
+        adapter = HTTPAdapter(pool_maxsize=self.max_workers, max_retries=retries)
+        self.session.mount("https://", adapter)
+
     def fetch_channel_feed(self, channel_id: str) -> Optional[Dict]:
         """Fetch RSS feed for a single YouTube channel."""
         try:
@@ -29,41 +89,46 @@ class YouTubeFeedFetcher:
             response = self.session.get(rss_url, timeout=30)
             response.raise_for_status()
 
-            feed = feedparser.parse(response.content)
-
-            if feed.bozo:
-                logger.warning(
-                    f"Feed parsing issues for channel {channel_id}: {feed.bozo_exception}"
-                )
+            # YouTube's feed layout is fixed, so read the fields we need
+            # directly instead of building a generic feed model
+            feed = ET.fromstring(response.content)
 
             return {
                 "channel_id": channel_id,
-                "channel_title": feed.feed.get("title", "Unknown Channel"),
-                "channel_link": feed.feed.get("link", ""),
-                "last_updated": datetime.now(pytz.UTC).isoformat(),
-                "videos": self._process_videos(feed.entries),
+                "channel_title": feed.findtext("atom:title", "Unknown Channel", _NS),
+                "channel_link": _alternate_link(feed),
+                "last_updated": datetime.now(timezone.utc).isoformat(),
+                "videos": self._process_videos(feed.findall("atom:entry", _NS)),
             }
 
         except requests.RequestException as e:
             logger.error(f"Network error fetching feed for {channel_id}: {e}")
             return None
+        except ET.ParseError as e:
+            logger.error(f"Feed parsing error for channel {channel_id}: {e}")
+            return None
         except Exception as e:
             logger.error(f"Error processing feed for {channel_id}: {e}")
             return None
 
-    def _process_videos(self, entries: List) -> List[Dict]:
+    def _process_videos(self, entries: List[ET.Element]) -> List[Dict]:
         """Process video entries from RSS feed."""
         videos = []
 
         for entry in entries:
             try:
+                fields = _entry_fields(entry)
+                link = fields.get("link", "")
+                video_id = fields.get("video_id") or self._extract_video_id(link)
                 video_data = {
-                    "title": entry.get("title", ""),
-                    "link": entry.get("link", ""),
-                    "published": entry.get("published", ""),
-                    "description": entry.get("summary", ""),
-                    "video_id": self._extract_video_id(entry.get("link", "")),
-                    "thumbnail": self._extract_thumbnail(entry),
+                    "title": fields.get("title", ""),
+                    "link": link,
+                    "published": fields.get("published", ""),
+                    "description": fields.get("description", ""),
+                    "video_id": video_id,
+                    "thumbnail": self._extract_thumbnail(
+                        fields.get("thumbnail", ""), video_id
+                    ),
                 }
                 videos.append(video_data)
             except Exception as e:
@@ -72,39 +137,42 @@ class YouTubeFeedFetcher:
 
         return videos
 
-    def _extract_video_id(self, video_url: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _extract_video_id(video_url: str) -> str:
         """Extract video ID from YouTube URL."""
-        try:
-            return video_url.split("v=")[1].split("&")[0]
-        except (IndexError, AttributeError):
-            return ""
+        match = _VIDEO_ID_RE.search(video_url or "")
+        return match.group(1) if match else ""
 
-    def _extract_thumbnail(self, entry) -> str:
-        """Extract thumbnail URL from video entry."""
-        try:
-            # Try to get thumbnail from media content
-            if hasattr(entry, "media_thumbnail"):
-                return entry.media_thumbnail[0]["url"]
+    def _extract_thumbnail(self, thumbnail_url: str, video_id: str) -> str:
+        """Return the media thumbnail, or one built from the video ID."""
+        if thumbnail_url:
+            return thumbnail_url
 
-            # Fallback to YouTube thumbnail URL using video ID
-            video_id = self._extract_video_id(entry.get("link", ""))
-            if video_id:
-                return f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
+        # Fallback to YouTube thumbnail URL using video ID
+        if video_id:
+            return f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
 
-            return ""
-        except Exception:
-            return ""
+        return ""
 
     def fetch_all_feeds(self) -> List[Dict]:
         """Fetch feeds for all configured channels."""
         all_feeds = []
-
-        for channel_id in self.config.YOUTUBE_CHANNELS:
-            channel_id = channel_id.strip()
-            if not channel_id:
-                continue
-
-            feed_data = self.fetch_channel_feed(channel_id)
+        channel_ids = [
+            channel_id.strip()
+            for channel_id in self.config.YOUTUBE_CHANNELS
+            if channel_id.strip()
+        ]
+        if not channel_ids:
+            return all_feeds
+
+        # Fetches are network-bound, so run them in parallel; map keeps the
+        # results in configured channel order
+        workers = min(self.max_workers, len(channel_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(self.fetch_channel_feed, channel_ids))
+
+        for channel_id, feed_data in zip(channel_ids, results):
             if feed_data:
                 all_feeds.append(feed_data)
             else:
@@ -117,13 +185,14 @@ class YouTubeFeedFetcher:
         try:
             filename = filename or self.config.OUTPUT_FILE
             output_data = {
-                "fetched_at": datetime.now(pytz.UTC).isoformat(),
+                "fetched_at": datetime.now(timezone.utc).isoformat(),
                 "total_channels": len(feeds),
                 "feeds": feeds,
             }
 
-            with open(filename, "w", encoding="utf-8") as f:
-                json.dump(output_data, f, indent=2, ensure_ascii=False)
+            # orjson emits UTF-8 bytes, so write them without a decode step
+            with open(filename, "wb") as f:
+                f.write(orjson.dumps(output_data, option=orjson.OPT_INDENT_2))
 
             logger.info(f"Feeds saved to {filename}")
             return True